@@ -1,2 +1,2 @@
-from .eln2rdf import get_group_name, json_data_from_zip_generator, parse_json_export, sanitize_uri_component, bind_prefixes_to_graph, resolve_string_to_uri, process_node,process_edges, plot_rdf_graph, process_data_with_mapping
+from .eln2rdf import get_group_name, json_data_from_zip_generator, parse_json_export, sanitize_uri_component, bind_prefixes_to_graph, resolve_string_to_uri, compile_mapping, build_triples, plot_rdf_graph, process_data_with_mapping
 
@@ -1,12 +1,18 @@
 import argparse
+import contextlib
+import functools
 import json
 import logging
 import os
+import re
 import sys
 import urllib.parse
 import warnings
 import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
+from itertools import islice
 
 import matplotlib.pyplot as plt
 import networkx as nx
@@ -14,19 +20,46 @@ import yaml
 from rdflib import Graph, Literal, Namespace, RDF, URIRef
 from rdflib.namespace import XSD
 
+# Optional accelerator: orjson parses JSON several times faster than the
+# stdlib and returns identical dict/list structures
+try:
+    import orjson
+
+    def _json_loads(raw):
+        return orjson.loads(raw)
+except ImportError:
+    _json_loads = json.loads
+
+# Optional accelerator: ijson stream-parses large exports without
+# materializing unused subtrees
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Exports larger than this are stream-parsed when ijson is available
+_STREAM_THRESHOLD = 1 << 20
+
+# The only top-level keys parse_json_export actually reads
+_STREAM_KEYS = frozenset({"elabid", "lastname", "items_links", "experiments_links", "metadata"})
+
 # Configure logging
 
 logger = logging.getLogger(__name__)
 
+# Pre-interned datatypes so the hot path skips the namespace attribute lookup
+_XSD_FLOAT = XSD.float
+_XSD_STRING = XSD.string
+
 
-def get_group_name(json_data, suffix="", default="", separator="-"):
+def get_group_name(json_data, suffix="", default=None, separator="-"):
     """
     Retrieves the name of the first group from the JSON data.
 
     Args:
         json_data (list[dict]): A list of dictionaries containing data.
         suffix (str, optional): A suffix to append to the group name. Defaults to "".
-        default (str, optional): Default value to return if no group is found. Defaults to "".
+        default (optional): Default value to return if no group is found. Defaults to None.
         separator (str, optional): Separator between the group name and suffix. Defaults to "-".
 
     Returns:
@@ -42,6 +75,85 @@ def get_group_name(json_data, suffix="", default="", separator="-"):
     return default
 
 
+def _json_bytes_from_zip_generator(zip_file, pattern):
+    """
+    A generator that yields the raw bytes of all JSON files within a zip
+    archive that match a given pattern. Decoding is left to the caller so
+    it can happen in worker processes.
+
+    Parameters:
+    - zip_file: file object or Path to the zip archive.
+    - pattern: Pattern to match the JSON file names within the archive. (currently matched with endswith() method)
+
+    Yields:
+    - Tuple: A tuple containing the name of the JSON file and its undecoded content as bytes.
+    """
+    suffixes = (pattern, '.eln')
+
+    def _candidate_infos(zf):
+        # Classify entries once per archive: drop macOS metadata and
+        # anything that is neither a matching JSON file nor a nested .eln
+        return [
+            info for info in zf.infolist()
+            if not info.filename.startswith(("__MACOSX/", "__MACOSX\\"))
+            and "/__MACOSX/" not in info.filename
+            and info.filename.endswith(suffixes)
+        ]
+
+    with contextlib.ExitStack() as stack:
+        try:
+            outer = stack.enter_context(zipfile.ZipFile(zip_file, 'r'))
+        except zipfile.BadZipFile as e:
+            logger.warning(f"BadZipFile error ({zip_file}): {e}")
+            return
+        except FileNotFoundError as e:
+            logger.warning(f"FileNotFoundError ({zip_file}): {e}")
+            return
+        except Exception as e:
+            logger.warning(f"An unexpected error occurred: {e}")
+            return
+
+        # Walk nested archives with an explicit stack of (archive, entry
+        # iterator, handles) triples instead of a generator frame per
+        # nesting level. Each level owns its file handles through its own
+        # ExitStack so an archive and its underlying stream stay open (and
+        # their parsed ZipInfo entries stay valid) exactly as long as the
+        # level is being walked; the outer stack still guarantees cleanup
+        # if the generator is abandoned early.
+        walk = [(outer, iter(_candidate_infos(outer)), contextlib.ExitStack())]
+        while walk:
+            zf, infos, level = walk[-1]
+            for info in infos:
+                file_name = info.filename
+                if file_name.endswith(pattern):
+                    try:
+                        with zf.open(info) as f:
+                            raw = f.read()
+                    except Exception as e:
+                        logger.warning(f"Error reading file {file_name}: {e}")
+                        continue
+                    logger.info(f"Processing file {file_name}")
+                    yield file_name, raw
+
+                else:  # Handle nested zip files (.eln)
+                    nested_level = stack.enter_context(contextlib.ExitStack())
+                    try:
+                        # Open the nested zip file as a stream instead of
+                        # reading the whole archive into memory
+                        nested_zf = nested_level.enter_context(
+                            zipfile.ZipFile(nested_level.enter_context(zf.open(info))))
+                    except Exception as e:
+                        nested_level.close()
+                        logger.warning(f"Error processing nested zip file ({file_name}): {e}")
+                        continue
+                    logger.info(f"Processing ELN export: ({file_name})")
+                    walk.append((nested_zf, iter(_candidate_infos(nested_zf)), nested_level))
+                    break
+            else:
+                walk.pop()
+                level.close()
+
+
 def json_data_from_zip_generator(zip_file, pattern):
     """
     A generator that yields the content of all JSON files within a zip archive
@@ -54,37 +166,13 @@ def json_data_from_zip_generator(zip_file, pattern):
     Yields:
     - Tuple: A tuple containing the name of the JSON file and its content as a Python dictionary.
     """
-    try:
-        with zipfile.ZipFile(zip_file, 'r') as z:
-            for file_name in z.namelist():
-                if "__MACOSX" in file_name:
-                    continue
-                if file_name.endswith(pattern):
-                    try:
-                        with z.open(file_name) as f:
-                            data = json.load(f)
-                            logger.info(f"Processing file {file_name}")
-                            yield file_name, data
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Error decoding JSON from file {file_name}: {e}")
-                    except Exception as e:
-                        logger.warning(f"Error processing file {file_name}: {e}")
-
-                elif file_name.endswith('.eln'):  # Handle nested zip files
-                    with z.open(file_name) as nested_zip_file:
-                        nested_zip_bytes = BytesIO(nested_zip_file.read())
-                        try:
-                            # Recursively process the nested zip file
-                            logger.info(f"Processing ELN export: ({file_name})")
-                            yield from json_data_from_zip_generator(nested_zip_bytes, pattern)
-                        except Exception as e:
-                            logger.warning(f"Error processing nested zip file ({file_name}): {e}")
-    except zipfile.BadZipFile as e:
-        logger.warning(f"BadZipFile error ({zip_file}): {e}")
-    except FileNotFoundError as e:
-        logger.warning(f"FileNotFoundError ({zip_file}): {e}")
-    except Exception as e:
-        logger.warning(f"An unexpected error occurred: {e}")
+    for file_name, raw in _json_bytes_from_zip_generator(zip_file, pattern):
+        try:
+            yield file_name, _json_loads(raw)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Error decoding JSON from file {file_name}: {e}")
+        except Exception as e:
+            logger.warning(f"Error processing file {file_name}: {e}")
 
 
 def parse_json_export(json_data, institute="Sample Institute"):
@@ -109,24 +197,28 @@ def parse_json_export(json_data, institute="Sample Institute"):
     """
 
     elabid = json_data.get("elabid", "")
+    group = get_group_name(json_data['items_links'], suffix=elabid[:4])
 
     metadata = {
         "elabid": elabid,
-        "group":  get_group_name(json_data['items_links'], suffix=elabid[:4]),
+        "group":  group if group is not None else "",
         "Institute": institute,
         "LastName": json_data.get('lastname', ""),
         "experiments_links": json_data.get('experiments_links', []),
         "fields": json_data['metadata']['extra_fields']
     }
 
-    if "" in metadata.values():
-        metadata["data_completeness"] = "incomplete"
-    else:
+    # Only elabid, group and LastName can actually be missing, so check
+    # them directly instead of scanning every value in the dict
+    if elabid and group is not None and metadata["LastName"]:
         metadata["data_completeness"] = "complete"
+    else:
+        metadata["data_completeness"] = "incomplete"
 
     return metadata
 
 
+@functools.lru_cache(maxsize=None)
 def sanitize_uri_component(component):
     """Sanitize a URI component by replacing spaces with underscores and escaping unsafe characters."""
     component = component.replace(" ", "_") 
@@ -134,9 +226,62 @@ def sanitize_uri_component(component):
 
 
 def bind_prefixes_to_graph(g, namespaces):
+    """
+    Bind the given prefixes to the graph and return them as a
+    {prefix: Namespace} dict, so callers can reuse the resolved
+    namespaces instead of re-querying g.namespaces() later.
+    """
+    ns_dict = {}
     for prefix, uri in namespaces.items():
         logger.debug(f"Binding prefix {prefix} to URI {uri}")
-        g.bind(prefix, Namespace(uri))
+        ns = Namespace(uri)
+        g.bind(prefix, ns)
+        ns_dict[prefix] = ns
+    return ns_dict
+
+
+def _decode_json(raw):
+    """
+    Decode one export's JSON bytes for the conversion pipeline.
+
+    Small files are decoded wholesale. Above _STREAM_THRESHOLD, when ijson
+    is installed, the file is stream-parsed and only the keys used by
+    parse_json_export are materialized; the result keeps the usual
+    list-of-dicts shape but holds just the first export object.
+    """
+    if ijson is None or len(raw) < _STREAM_THRESHOLD:
+        return _json_loads(raw)
+    item = {}
+    seen = set()
+    for key, value in ijson.kvitems(BytesIO(raw), 'item'):
+        if key in seen:
+            # A repeated key means we crossed into the next export object
+            break
+        seen.add(key)
+        if key in _STREAM_KEYS:
+            item[key] = value
+            if len(item) == len(_STREAM_KEYS):
+                break
+    return [item]
+
+
+def _make_resolver(namespaces):
+    """
+    Return a memoizing resolve(string) closure over the given namespaces.
+
+    The same handful of CURIEs shows up once per triple, so a dict lookup
+    replaces split + URIRef construction on repeated calls.
+    """
+    uri_cache = {}
+
+    def resolve(string):
+        uri = uri_cache.get(string)
+        if uri is None:
+            uri = resolve_string_to_uri(string, namespaces)
+            uri_cache[string] = uri
+        return uri
+
+    return resolve
 
 
 def resolve_string_to_uri(string, namespaces):
@@ -151,74 +296,205 @@ def resolve_string_to_uri(string, namespaces):
     return URIRef(string)
 
 
-def process_node(node_mapping, g, namespaces=None, elabid="",
-                 unit_namespace="qudt", unit_predicate=None, value_predicate=None, **kwargs):
+def compile_mapping(data_mapping, namespaces, resolve=None):
+    """
+    Resolve a YAML keymap into flat spec tuples for build_triples.
 
-    fields = kwargs.get('fields', {})
-    subject_template = node_mapping['subject_template']
-    field_name =  node_mapping.get('json_field')
-    if field_name in kwargs:
-        field_data = {'value': kwargs[field_name]}
-    else:
-        field_data = fields.get(field_name, {})
-
-    subject_str = subject_template.format(elabid=sanitize_uri_component(elabid))
-    subject = resolve_string_to_uri(subject_str, namespaces)
-    # Add types
-    for rdf_type in node_mapping.get('types', []):
-        g.add((subject, RDF.type, resolve_string_to_uri(rdf_type, namespaces)))
-
-    # Add unit and value predicates if they exist
-    if 'unit' in field_data:
-        unit_uri = namespaces[unit_namespace][sanitize_uri_component(field_data['unit'])]
-        g.add((subject, unit_predicate, unit_uri))
-    if 'value' in field_data:
-        value = field_data['value']
-        datatype = field_data.get('type', 'string')
-        try:
+    Every per-node template and CURIE is resolved here, once per run, so
+    the per-experiment loop only touches plain tuples.
+
+    Returns:
+        tuple: (node_specs, edge_specs). node_specs is a list of
+        (node_name, subject_fn, types_uris, json_field) tuples; edge_specs
+        is a flat list of (source_name, predicate_uri, target_name) tuples.
+    """
+    if resolve is None:
+        resolve = _make_resolver(namespaces)
+    node_specs = []
+    for node_name, node_mapping in data_mapping['nodes'].items():
+        prefix, _, suffix = node_mapping['subject_template'].partition('{elabid}')
+        node_specs.append((
+            node_name,
+            lambda eid, _pre=prefix, _suf=suffix: _pre + eid + _suf,
+            tuple(resolve(t) for t in node_mapping.get('types', [])),
+            node_mapping.get('json_field'),
+        ))
+    edge_specs = [
+        (source_node, resolve(predicate), target_node)
+        for predicate, source_targets in data_mapping.get('edges', {}).items()
+        for source_node, target_nodes in source_targets.items()
+        for target_node in target_nodes
+    ]
+    return node_specs, edge_specs
+
+
+def build_triples(data_item, node_specs, edge_specs, namespaces, general_config, resolve):
+    """
+    Produce the triples for one experiment from precompiled specs.
+
+    This is the hot inner loop: templates, type URIs and edge predicates
+    have been resolved ahead of time by compile_mapping, so each iteration
+    only does dict lookups, string concatenation and tuple construction.
+
+    Returns:
+        list[tuple]: The (subject, predicate, object) triples.
+    """
+    triples = []
+    append = triples.append
+    fields = data_item.get('fields', {})
+    unit_namespace = namespaces[general_config['unit_namespace']]
+    unit_predicate = general_config['unit_predicate']
+    value_predicate = general_config['value_predicate']
+    elabid_safe = sanitize_uri_component(data_item.get('elabid', ''))
+    rdf_type = RDF.type
+
+    nodes = {}
+    for node_name, subject_fn, types_uris, json_field in node_specs:
+        subject = resolve(subject_fn(elabid_safe))
+        nodes[node_name] = subject
+        for type_uri in types_uris:
+            append((subject, rdf_type, type_uri))
+
+        if json_field in data_item:
+            field_data = {'value': data_item[json_field]}
+        else:
+            field_data = fields.get(json_field, {})
+
+        # Add unit and value predicates if they exist
+        if 'unit' in field_data:
+            unit_uri = unit_namespace[sanitize_uri_component(field_data['unit'])]
+            append((subject, unit_predicate, unit_uri))
+        if 'value' in field_data:
+            value = field_data['value']
+            datatype = field_data.get('type', 'string')
             if datatype == 'number':
-                literal = Literal(float(value), datatype=XSD.float)
+                # Values decoded from JSON are usually already numeric, so
+                # branch on the type first and keep the try/except off the
+                # hot path; bool is an int subclass but must go through
+                # float() to serialize as a valid xsd:float
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    literal = Literal(value, datatype=_XSD_FLOAT)
+                else:
+                    try:
+                        literal = Literal(float(value), datatype=_XSD_FLOAT)
+                    except (TypeError, ValueError):
+                        logger.warning(f"Could not convert value '{value}' to datatype {datatype}. Using string.")
+                        literal = Literal(value, datatype=_XSD_STRING)
             else:
-                literal = Literal(value, datatype=XSD.string)
-        except ValueError:
-            logger.warning(f"Could not convert value '{value}' to datatype {datatype}. Using string.")
-            literal = Literal(value, datatype=XSD.string)
-        g.add((subject, value_predicate, literal))
-    return subject
-
-
-def process_edges(g, edges, nodes_dict, namespaces):
-    # Iterate over predicates in the edges mapping
-    for predicate, source_targets in edges.items():
-        # Loop through each source node and its target nodes
-        for source_node, target_nodes in source_targets.items():
-            # Get the source node URIRef from the nodes dictionary
-            source_uri = nodes_dict.get(source_node)
-            # Loop through each target node
-            for target_node in target_nodes:
-                # Get the target node URIRef from the nodes dictionary
-                target_uri = nodes_dict.get(target_node)
-                # Add the edge to the graph
-                g.add((source_uri, resolve_string_to_uri(predicate, namespaces), target_uri))
+                literal = Literal(value, datatype=_XSD_STRING)
+            append((subject, value_predicate, literal))
+
+    # Edges whose endpoints are missing from the node dict are skipped
+    for source_node, predicate_uri, target_node in edge_specs:
+        source_uri = nodes.get(source_node)
+        target_uri = nodes.get(target_node)
+        if source_uri is not None and target_uri is not None:
+            append((source_uri, predicate_uri, target_uri))
+    return triples
+
+
+# Conservative subset of Turtle's PN_LOCAL grammar: ASCII name characters
+# plus '.', '-' and %XX escapes, not starting with '.' or '-' and not
+# ending with '.'. Anything outside this is emitted as a full <uri>.
+_PN_LOCAL_RE = re.compile(
+    r'(?:[A-Za-z0-9_]|%[0-9A-Fa-f]{2})'
+    r'(?:(?:[A-Za-z0-9_.\-]|%[0-9A-Fa-f]{2})*'
+    r'(?:[A-Za-z0-9_\-]|%[0-9A-Fa-f]{2}))?\Z'
+)
+
+
+def _make_curie_compactor(namespaces):
+    """
+    Return a compact(uri) function that shortens URIs to CURIEs.
+
+    rdflib's serializer does a linear scan over all bound namespaces per
+    URI. Since every URI we emit splits at its last '/' or '#', the
+    namespace part can instead be looked up in a reversed {uri: prefix}
+    dict, making compaction O(len(uri)) with a single hash lookup.
+    """
+    uri_to_prefix = {str(uri): prefix for prefix, uri in namespaces.items()}
+
+    def compact(uri):
+        s = str(uri)
+        cut = max(s.rfind('/'), s.rfind('#')) + 1
+        if cut:
+            prefix = uri_to_prefix.get(s[:cut])
+            if prefix is not None:
+                local = s[cut:]
+                # Only emit a CURIE when the local part is legal Turtle;
+                # sanitize_uri_component keeps '.' and '~', which can
+                # otherwise produce unparseable names like qudt:mm.
+                if _PN_LOCAL_RE.match(local):
+                    return f"{prefix}:{local}"
+        return f"<{s}>"
+
+    return compact
+
+
+_TURTLE_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'})
+
+
+def _format_turtle_term(term, compact):
+    """Format a single RDF term (URIRef or Literal) for Turtle output."""
+    if isinstance(term, Literal):
+        lexical = str(term).translate(_TURTLE_ESCAPES)
+        datatype = term.datatype
+        if datatype is not None:
+            return f'"{lexical}"^^{compact(datatype)}'
+        return f'"{lexical}"'
+    return compact(term)
+
+
+def _write_turtle_block(out, triples, compact):
+    """
+    Write one experiment's triples to an open file as Turtle subject
+    blocks, grouped by subject and predicate, without going through an
+    rdflib Graph.
+    """
+    by_subject = {}
+    for s, p, o in triples:
+        # The inner dict doubles as an ordered set, deduplicating repeated
+        # triples the way a Graph would
+        by_subject.setdefault(s, {}).setdefault(p, {})[o] = None
+    for subject, predicates in by_subject.items():
+        parts = []
+        for predicate, objects in predicates.items():
+            pred_str = 'a' if predicate == RDF.type else compact(predicate)
+            objs = ', '.join(_format_turtle_term(o, compact) for o in objects)
+            parts.append(f"{pred_str} {objs}")
+        out.write(f"{compact(subject)} " + " ;\n    ".join(parts) + " .\n\n")
 
 
 def plot_rdf_graph(rdf_graph, image_filename):
     # Create a NetworkX graph
     nx_graph = nx.DiGraph()
 
-    # Convert RDF triples to NetworkX graph
+    # Convert RDF triples to NetworkX edges in one pass, building the
+    # edge labels alongside instead of iterating the graph a second time
+    edges = []
+    edge_labels = {}
     for subj, pred, obj in rdf_graph:
-        nx_graph.add_edge(subj, obj, label=pred)
-
-    # Set positions for the nodes in the graph
-    pos = nx.spring_layout(nx_graph, k=0.5, iterations=50)
+        edges.append((subj, obj, {'label': pred}))
+        edge_labels[(subj, obj)] = pred.split('/')[-1]
+    nx_graph.add_edges_from(edges)
+
+    # Set positions for the nodes in the graph. Above a few hundred nodes
+    # the spring iterations dominate the plot, so prefer the LAPACK-backed
+    # Kamada-Kawai layout there when scipy is available; spring_layout
+    # itself also switches to scipy's sparse path for graphs this size.
+    if nx_graph.number_of_nodes() > 500:
+        try:
+            pos = nx.kamada_kawai_layout(nx_graph)
+        except ImportError:
+            pos = nx.spring_layout(nx_graph, k=0.5, iterations=50, seed=0)
+    else:
+        pos = nx.spring_layout(nx_graph, k=0.5, iterations=50, seed=0)
 
     # Draw the nodes and edges
     plt.figure(figsize=(12, 12))
     nx.draw(nx_graph, pos, with_labels=True, node_size=3000, node_color="lightblue", font_size=10, font_weight="bold", arrows=True)
 
     # Draw edge labels (predicates)
-    edge_labels = {(u, v): d['label'].split('/')[-1] for u, v, d in nx_graph.edges(data=True)}
     nx.draw_networkx_edge_labels(nx_graph, pos, edge_labels=edge_labels, font_color='red')
 
     # Save the plot to an image file
@@ -228,22 +504,80 @@ def plot_rdf_graph(rdf_graph, image_filename):
     plt.close()
 
 
-def process_data_with_mapping(g, data_item, data_mapping):
+def process_data_with_mapping(triples, data_item, data_mapping, namespaces, general_config,
+                              resolve=None):
+
+    if resolve is None:
+        resolve = _make_resolver(namespaces)
+
+    # Compile the mapping on first use and cache the specs on it
+    compiled = data_mapping.get('_compiled')
+    if compiled is None:
+        compiled = data_mapping['_compiled'] = compile_mapping(data_mapping, namespaces, resolve)
+    node_specs, edge_specs = compiled
+
+    triples.extend(build_triples(data_item, node_specs, edge_specs,
+                                 namespaces, general_config, resolve))
+
 
-    nodes = dict()
-    namespaces =  {p: Namespace(u) for p, u in g.namespaces()}
-    general_config = {
-        "unit_namespace": data_mapping.get('unit_namespace', 'qudt'),
-        "unit_predicate": resolve_string_to_uri(data_mapping.get('unit_predicate'), namespaces),
-        "value_predicate": resolve_string_to_uri(data_mapping.get('value_predicate'), namespaces)
+# Per-worker state, set up once by _init_worker instead of being pickled
+# along with every work item
+_WORKER = {}
+
+
+def _init_worker(keymap):
+    """Initializer for worker processes: resolve the keymap once per worker."""
+    namespaces = {p: Namespace(u) for p, u in keymap['namespaces'].items()}
+    resolve = _make_resolver(namespaces)
+    _WORKER['keymap'] = keymap
+    _WORKER['namespaces'] = namespaces
+    _WORKER['resolve'] = resolve
+    _WORKER['general_config'] = {
+        "unit_namespace": keymap.get('unit_namespace', 'qudt'),
+        "unit_predicate": resolve(keymap.get('unit_predicate')),
+        "value_predicate": resolve(keymap.get('value_predicate'))
     }
-    # Process each node
-    for node_name, node_mapping in data_mapping['nodes'].items():
-        node_subj = process_node(node_mapping, g, namespaces=namespaces, **data_item, **general_config)
-        nodes[node_name] = node_subj
+    _WORKER['node_specs'], _WORKER['edge_specs'] = compile_mapping(keymap, namespaces, resolve)
 
-    # Process edges
-    process_edges(g, data_mapping.get('edges', {}), nodes, namespaces)
+
+def _process_one(item):
+    """
+    Process a single (file_name, raw_bytes) work item in a worker process.
+
+    Returns:
+        tuple: The file name and the list of triples produced for it.
+    """
+    file_name, raw = item
+    triples = []
+    try:
+        json_data = _decode_json(raw)
+        elab_data = parse_json_export(json_data[0])
+        triples = build_triples(elab_data, _WORKER['node_specs'], _WORKER['edge_specs'],
+                                _WORKER['namespaces'], _WORKER['general_config'],
+                                _WORKER['resolve'])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Error decoding JSON from file {file_name}: {e}")
+    except Exception as e:
+        logger.warning(f"Error processing file {file_name}: {e}")
+    return file_name, triples
+
+
+def _map_bounded(executor, fn, iterable, max_in_flight):
+    """
+    Like Executor.map, but keeps at most max_in_flight items submitted.
+
+    Executor.map drains its input iterable up front, which would pull
+    every file's raw bytes into memory at once; this submits a bounded
+    window and tops it up from the iterable as results are yielded, in
+    input order.
+    """
+    iterator = iter(iterable)
+    pending = deque(executor.submit(fn, item) for item in islice(iterator, max_in_flight))
+    while pending:
+        result = pending.popleft().result()
+        for item in islice(iterator, 1):
+            pending.append(executor.submit(fn, item))
+        yield result
 
 
 def main():
@@ -284,20 +618,39 @@ def main():
         sys.exit(1)
 
     try:
-        # Create a fresh RDF graph each time
-        data_graph = Graph()
-
-        # Bind the prefixes to the RDF graph
-        bind_prefixes_to_graph(data_graph, keymap['namespaces'])
-
-        # Process each file in the ELN export
-        for file_name, json_data in json_data_from_zip_generator(eln_export, pattern):
-            # Parse the JSON export data using parse_json_export
-            elab_data = parse_json_export(json_data[0])
-            process_data_with_mapping(data_graph, elab_data, keymap)
+        # The full graph is only kept in memory when it is needed for
+        # plotting; the Turtle output itself is streamed per experiment
+        data_graph = None
+        if args.plot:
+            data_graph = Graph()
+            bind_prefixes_to_graph(data_graph, keymap['namespaces'])
+
+        # Each file yields an independent subgraph, so JSON decoding and
+        # triple construction are farmed out to a process pool; only the
+        # merge and serialization stay serial
+        raw_files = _json_bytes_from_zip_generator(eln_export, pattern)
+        compact = _make_curie_compactor(keymap['namespaces'])
+        with open(output_file, 'w', encoding='utf-8') as out:
+            # Emit the prefix header once
+            for prefix, uri in keymap['namespaces'].items():
+                out.write(f"@prefix {prefix}: <{uri}> .\n")
+            out.write("\n")
+
+            max_workers = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_worker, initargs=(keymap,)) as executor:
+                for file_name, file_triples in _map_bounded(executor, _process_one,
+                                                            raw_files, 2 * max_workers):
+                    if not file_triples:
+                        continue
+                    # Emit each experiment's subject blocks directly,
+                    # bypassing rdflib's serializer and its per-URI
+                    # namespace scan
+                    _write_turtle_block(out, file_triples, compact)
+
+                    if data_graph is not None:
+                        data_graph.addN((s, p, o, data_graph) for s, p, o in file_triples)
 
-        # Serialize the graph to a Turtle file
-        data_graph.serialize(destination=output_file, format='turtle')
         logger.info(f"RDF graph serialized to {output_file}")
 
         # Plot RDF graph if --plot option is enabled